@@ -5,3 +5,8 @@ from pytest_django.fixtures import SettingsWrapper
 @pytest.fixture(autouse=True)
 def _disable_linear(settings: SettingsWrapper) -> None:
     settings.LINEAR = None
+
+
+@pytest.fixture(autouse=True)
+def _fast_password_hasher(settings: SettingsWrapper) -> None:
+    settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
@@ -5,7 +5,7 @@ from django.conf import settings
 from django.contrib.auth.models import User
 from django.core.exceptions import ImproperlyConfigured, ValidationError
 from django.db import models, transaction
-from django.db.models import Q, QuerySet
+from django.db.models import Exists, OuterRef, Q, QuerySet
 
 INCIDENT_ID_START = 2000
 
@@ -428,9 +428,14 @@ def filter_visible_to_user(
     if not user.is_authenticated:
         return queryset.none()
 
+    # A correlated EXISTS rather than a join on participants, so each incident
+    # matches at most once and the result doesn't need DISTINCT.
+    is_participant = Exists(
+        Incident.participants.through.objects.filter(incident=OuterRef("pk"), user=user)
+    )
     return queryset.filter(
-        Q(is_private=False) | Q(captain=user) | Q(reporter=user) | Q(participants=user)
-    ).distinct()
+        Q(is_private=False) | Q(captain=user) | Q(reporter=user) | is_participant
+    )
 
 
 @dataclass
@@ -44,6 +44,24 @@ class ParticipantsSyncStats:
     skipped: bool = False
 
 
+def _resolve_slack_users(slack_user_ids: list[str]) -> dict[str, User | None]:
+    existing_users = {
+        profile.external_id: profile.user
+        for profile in ExternalProfile.objects.filter(
+            type=ExternalProfileType.SLACK, external_id__in=slack_user_ids
+        ).select_related("user")
+    }
+
+    resolved: dict[str, User | None] = {}
+    for slack_user_id in slack_user_ids:
+        user = existing_users.get(slack_user_id)
+        if not user:
+            user = get_or_create_user_from_slack_id(slack_user_id)
+        resolved[slack_user_id] = user
+
+    return resolved
+
+
 def sync_incident_participants_from_slack(
     incident: Incident, force: bool = False
 ) -> ParticipantsSyncStats:
@@ -101,13 +119,14 @@ def sync_incident_participants_from_slack(
     existing_participant_ids = set(incident.participants.values_list("id", flat=True))
     new_participants = []
 
+    member_ids = []
     for slack_user_id in slack_member_ids:
         if slack_user_id.startswith("B"):
             logger.info(f"Skipping bot: {slack_user_id}")
             continue
+        member_ids.append(slack_user_id)
 
-        user = get_or_create_user_from_slack_id(slack_user_id)
-
+    for slack_user_id, user in _resolve_slack_users(member_ids).items():
         if not user:
             logger.info(
                 f"Skipping Slack user {slack_user_id} - could not resolve to a Firetower user"
@@ -129,8 +148,12 @@ def sync_incident_participants_from_slack(
             f"Added {len(new_participants)} new participants to incident {incident.id}"
         )
 
+    # A plain UPDATE: save() would re-run full_clean(), which looks up the
+    # captain and reporter rows just to bump a timestamp.
     incident.participants_last_synced_at = timezone.now()
-    incident.save(update_fields=["participants_last_synced_at"])
+    Incident.objects.filter(pk=incident.pk).update(
+        participants_last_synced_at=incident.participants_last_synced_at
+    )
 
     logger.info(
         f"Sync complete for incident {incident.id}: {stats.added} added, "
@@ -0,0 +1,43 @@
+import pytest
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from firetower.incidents.models import Incident, IncidentCounter
+
+
+@pytest.fixture
+def bulk_create_incidents(db):
+    """Insert incidents in a single query, assigning ids from the counter up front."""
+
+    def create(*incidents: Incident) -> list[Incident]:
+        with transaction.atomic():
+            counter = IncidentCounter.objects.select_for_update().get(pk=1)
+            first_id = counter.next_id
+            counter.next_id += len(incidents)
+            counter.save()
+        for incident_id, incident in enumerate(incidents, start=first_id):
+            incident.id = incident_id
+        return Incident.objects.bulk_create(incidents)
+
+    return create
+
+
+@pytest.fixture
+def assert_query_count_stable():
+    """GET a small and a large result and check both take the same number of queries.
+
+    Catches N+1 regressions in list and detail views. Returns the large response.
+    """
+
+    def check(client, small_path, large_path):
+        # Without IAP the auth middleware creates its dev user on the first
+        # request, so make one uncounted request before comparing.
+        client.get(small_path)
+        with CaptureQueriesContext(connection) as small:
+            client.get(small_path)
+        with CaptureQueriesContext(connection) as large:
+            response = client.get(large_path)
+        assert len(large) == len(small)
+        return response
+
+    return check
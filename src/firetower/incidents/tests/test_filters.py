@@ -1,8 +1,7 @@
-from datetime import datetime
+from datetime import UTC, datetime
 
 import pytest
 from django.contrib.auth.models import User
-from django.utils import timezone as django_timezone
 from rest_framework.test import APIClient
 
 from firetower.incidents.models import (
@@ -14,6 +13,10 @@ from firetower.incidents.models import (
     TagType,
 )
 
+JAN_1_2024 = datetime(2024, 1, 1, tzinfo=UTC)
+JUN_15_2024 = datetime(2024, 6, 15, 12, 0, tzinfo=UTC)
+DEC_1_2024 = datetime(2024, 12, 1, tzinfo=UTC)
+
 
 @pytest.mark.django_db
 class TestUIIncidentFilters:
@@ -24,20 +27,22 @@ class TestUIIncidentFilters:
             email="test@example.com",
             password="testpass123",
         )
+        self.client.force_authenticate(user=self.user)
 
-    def test_filter_by_status(self):
-        Incident.objects.create(
-            title="Active Incident",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-        )
-        Incident.objects.create(
-            title="Mitigated Incident",
-            status=IncidentStatus.MITIGATED,
-            severity=IncidentSeverity.P2,
+    def test_filter_by_status(self, bulk_create_incidents):
+        bulk_create_incidents(
+            Incident(
+                title="Active Incident",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+            ),
+            Incident(
+                title="Mitigated Incident",
+                status=IncidentStatus.MITIGATED,
+                severity=IncidentSeverity.P2,
+            ),
         )
 
-        self.client.force_authenticate(user=self.user)
         response = self.client.get("/api/ui/incidents/?status=Active")
 
         assert response.status_code == 200
@@ -45,130 +50,121 @@ class TestUIIncidentFilters:
         assert len(response.data["results"]) == 1
         assert response.data["results"][0]["title"] == "Active Incident"
 
-    def test_filter_by_multiple_statuses(self):
-        Incident.objects.create(
-            title="Active",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-        )
-        Incident.objects.create(
-            title="Mitigated",
-            status=IncidentStatus.MITIGATED,
-            severity=IncidentSeverity.P2,
-        )
-        Incident.objects.create(
-            title="Done",
-            status=IncidentStatus.DONE,
-            severity=IncidentSeverity.P3,
+    def test_filter_by_multiple_statuses(self, bulk_create_incidents):
+        bulk_create_incidents(
+            Incident(
+                title="Active",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+            ),
+            Incident(
+                title="Mitigated",
+                status=IncidentStatus.MITIGATED,
+                severity=IncidentSeverity.P2,
+            ),
+            Incident(
+                title="Done",
+                status=IncidentStatus.DONE,
+                severity=IncidentSeverity.P3,
+            ),
         )
 
-        self.client.force_authenticate(user=self.user)
         response = self.client.get("/api/ui/incidents/?status=Active&status=Mitigated")
 
         assert response.status_code == 200
         assert response.data["count"] == 2
         assert len(response.data["results"]) == 2
 
-    def test_filter_by_status_any(self):
-        Incident.objects.create(
-            title="Active",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-        )
-        Incident.objects.create(
-            title="Done",
-            status=IncidentStatus.DONE,
-            severity=IncidentSeverity.P2,
-        )
-        Incident.objects.create(
-            title="Canceled",
-            status=IncidentStatus.CANCELED,
-            severity=IncidentSeverity.P3,
+    def test_filter_by_status_any(self, bulk_create_incidents):
+        bulk_create_incidents(
+            Incident(
+                title="Active",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+            ),
+            Incident(
+                title="Done",
+                status=IncidentStatus.DONE,
+                severity=IncidentSeverity.P2,
+            ),
+            Incident(
+                title="Canceled",
+                status=IncidentStatus.CANCELED,
+                severity=IncidentSeverity.P3,
+            ),
         )
 
-        self.client.force_authenticate(user=self.user)
         response = self.client.get("/api/ui/incidents/?status=Any")
 
         assert response.status_code == 200
         assert response.data["count"] == 3
 
-    def test_filter_by_created_after(self):
-        inc1 = Incident.objects.create(
-            title="Old Incident",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-        )
-        inc2 = Incident.objects.create(
-            title="New Incident",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-        )
-        Incident.objects.filter(pk=inc1.pk).update(
-            created_at=django_timezone.make_aware(datetime(2024, 1, 1, 0, 0, 0))
-        )
-        Incident.objects.filter(pk=inc2.pk).update(
-            created_at=django_timezone.make_aware(datetime(2024, 6, 15, 12, 0, 0))
-        )
+    def test_filter_by_created_after(self, bulk_create_incidents):
+        inc1, inc2 = bulk_create_incidents(
+            Incident(
+                title="Old Incident",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+            ),
+            Incident(
+                title="New Incident",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+            ),
+        )
+        Incident.objects.filter(pk=inc1.pk).update(created_at=JAN_1_2024)
+        Incident.objects.filter(pk=inc2.pk).update(created_at=JUN_15_2024)
 
-        self.client.force_authenticate(user=self.user)
         response = self.client.get("/api/ui/incidents/?created_after=2024-06-01")
 
         assert response.status_code == 200
         assert response.data["count"] == 1
         assert response.data["results"][0]["title"] == "New Incident"
 
-    def test_filter_by_created_before(self):
-        inc1 = Incident.objects.create(
-            title="Old Incident",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-        )
-        inc2 = Incident.objects.create(
-            title="New Incident",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-        )
-        Incident.objects.filter(pk=inc1.pk).update(
-            created_at=django_timezone.make_aware(datetime(2024, 1, 1, 0, 0, 0))
-        )
-        Incident.objects.filter(pk=inc2.pk).update(
-            created_at=django_timezone.make_aware(datetime(2024, 6, 15, 12, 0, 0))
-        )
+    def test_filter_by_created_before(self, bulk_create_incidents):
+        inc1, inc2 = bulk_create_incidents(
+            Incident(
+                title="Old Incident",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+            ),
+            Incident(
+                title="New Incident",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+            ),
+        )
+        Incident.objects.filter(pk=inc1.pk).update(created_at=JAN_1_2024)
+        Incident.objects.filter(pk=inc2.pk).update(created_at=JUN_15_2024)
 
-        self.client.force_authenticate(user=self.user)
         response = self.client.get("/api/ui/incidents/?created_before=2024-06-01")
 
         assert response.status_code == 200
         assert response.data["count"] == 1
         assert response.data["results"][0]["title"] == "Old Incident"
 
-    def test_filter_by_date_range(self):
-        inc1 = Incident.objects.create(
-            title="Too Old",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-        )
-        inc2 = Incident.objects.create(
-            title="In Range",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-        )
-        inc3 = Incident.objects.create(
-            title="Too New",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-        )
-        Incident.objects.filter(pk=inc1.pk).update(
-            created_at=django_timezone.make_aware(datetime(2024, 1, 1, 0, 0, 0))
-        )
-        Incident.objects.filter(pk=inc2.pk).update(
-            created_at=django_timezone.make_aware(datetime(2024, 6, 15, 12, 0, 0))
-        )
-        Incident.objects.filter(pk=inc3.pk).update(
-            created_at=django_timezone.make_aware(datetime(2024, 12, 1, 0, 0, 0))
-        )
+    def test_filter_by_date_range(self, bulk_create_incidents):
+        inc1, inc2, inc3 = bulk_create_incidents(
+            Incident(
+                title="Too Old",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+            ),
+            Incident(
+                title="In Range",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+            ),
+            Incident(
+                title="Too New",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+            ),
+        )
+        Incident.objects.filter(pk=inc1.pk).update(created_at=JAN_1_2024)
+        Incident.objects.filter(pk=inc2.pk).update(created_at=JUN_15_2024)
+        Incident.objects.filter(pk=inc3.pk).update(created_at=DEC_1_2024)
 
-        self.client.force_authenticate(user=self.user)
         response = self.client.get(
             "/api/ui/incidents/?created_after=2024-06-01&created_before=2024-07-01"
         )
@@ -184,11 +180,9 @@ class TestUIIncidentFilters:
             severity=IncidentSeverity.P1,
         )
         Incident.objects.filter(pk=inc.pk).update(
-            created_at=django_timezone.make_aware(datetime(2024, 6, 15, 14, 30, 0))
+            created_at=datetime(2024, 6, 15, 14, 30, tzinfo=UTC)
         )
 
-        self.client.force_authenticate(user=self.user)
-
         response = self.client.get(
             "/api/ui/incidents/?created_after=2024-06-15T14:00:00"
         )
@@ -208,11 +202,9 @@ class TestUIIncidentFilters:
             severity=IncidentSeverity.P1,
         )
         Incident.objects.filter(pk=inc.pk).update(
-            created_at=django_timezone.make_aware(datetime(2024, 6, 15, 14, 0, 0))
+            created_at=datetime(2024, 6, 15, 14, 0, tzinfo=UTC)
         )
 
-        self.client.force_authenticate(user=self.user)
-
         response = self.client.get(
             "/api/ui/incidents/?created_after=2024-06-15T14:00:00Z"
         )
@@ -238,8 +230,6 @@ class TestUIIncidentFilters:
         assert response.data["count"] == 0
 
     def test_invalid_date_format(self):
-        self.client.force_authenticate(user=self.user)
-
         response = self.client.get("/api/ui/incidents/?created_after=invalid-date")
         assert response.status_code == 400
         assert "created_after" in response.data
@@ -248,19 +238,20 @@ class TestUIIncidentFilters:
         assert response.status_code == 400
         assert "created_before" in response.data
 
-    def test_filter_by_severity(self):
-        Incident.objects.create(
-            title="P1 Incident",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-        )
-        Incident.objects.create(
-            title="P2 Incident",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P2,
+    def test_filter_by_severity(self, bulk_create_incidents):
+        bulk_create_incidents(
+            Incident(
+                title="P1 Incident",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+            ),
+            Incident(
+                title="P2 Incident",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P2,
+            ),
         )
 
-        self.client.force_authenticate(user=self.user)
         response = self.client.get("/api/ui/incidents/?severity=P1")
 
         assert response.status_code == 200
@@ -268,48 +259,50 @@ class TestUIIncidentFilters:
         assert len(response.data["results"]) == 1
         assert response.data["results"][0]["title"] == "P1 Incident"
 
-    def test_filter_by_multiple_severities(self):
-        Incident.objects.create(
-            title="P1 Incident",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-        )
-        Incident.objects.create(
-            title="P2 Incident",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P2,
-        )
-        Incident.objects.create(
-            title="P3 Incident",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P3,
+    def test_filter_by_multiple_severities(self, bulk_create_incidents):
+        bulk_create_incidents(
+            Incident(
+                title="P1 Incident",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+            ),
+            Incident(
+                title="P2 Incident",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P2,
+            ),
+            Incident(
+                title="P3 Incident",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P3,
+            ),
         )
 
-        self.client.force_authenticate(user=self.user)
         response = self.client.get("/api/ui/incidents/?severity=P1&severity=P2")
 
         assert response.status_code == 200
         assert response.data["count"] == 2
         assert len(response.data["results"]) == 2
 
-    def test_filter_by_severity_and_status(self):
-        Incident.objects.create(
-            title="Active P1",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-        )
-        Incident.objects.create(
-            title="Mitigated P1",
-            status=IncidentStatus.MITIGATED,
-            severity=IncidentSeverity.P1,
-        )
-        Incident.objects.create(
-            title="Active P2",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P2,
+    def test_filter_by_severity_and_status(self, bulk_create_incidents):
+        bulk_create_incidents(
+            Incident(
+                title="Active P1",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+            ),
+            Incident(
+                title="Mitigated P1",
+                status=IncidentStatus.MITIGATED,
+                severity=IncidentSeverity.P1,
+            ),
+            Incident(
+                title="Active P2",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P2,
+            ),
         )
 
-        self.client.force_authenticate(user=self.user)
         response = self.client.get("/api/ui/incidents/?severity=P1&status=Active")
 
         assert response.status_code == 200
@@ -317,44 +310,47 @@ class TestUIIncidentFilters:
         assert len(response.data["results"]) == 1
         assert response.data["results"][0]["title"] == "Active P1"
 
-    def test_filter_by_tag(self):
-        inc1 = Incident.objects.create(
-            title="API Down",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-        )
-        inc2 = Incident.objects.create(
-            title="DB Down",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
+    def test_filter_by_tag(self, bulk_create_incidents):
+        inc1, inc2 = bulk_create_incidents(
+            Incident(
+                title="API Down",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+            ),
+            Incident(
+                title="DB Down",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+            ),
         )
         tag_api = Tag.objects.create(name="API", type=TagType.AFFECTED_SERVICE)
         tag_db = Tag.objects.create(name="Database", type=TagType.AFFECTED_SERVICE)
         inc1.affected_service_tags.add(tag_api)
         inc2.affected_service_tags.add(tag_db)
 
-        self.client.force_authenticate(user=self.user)
         response = self.client.get("/api/ui/incidents/?affected_service=API")
 
         assert response.status_code == 200
         assert response.data["count"] == 1
         assert response.data["results"][0]["title"] == "API Down"
 
-    def test_filter_by_multiple_tags_same_type(self):
-        inc1 = Incident.objects.create(
-            title="API Down",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-        )
-        inc2 = Incident.objects.create(
-            title="DB Down",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-        )
-        inc3 = Incident.objects.create(
-            title="Cache Down",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
+    def test_filter_by_multiple_tags_same_type(self, bulk_create_incidents):
+        inc1, inc2, inc3 = bulk_create_incidents(
+            Incident(
+                title="API Down",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+            ),
+            Incident(
+                title="DB Down",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+            ),
+            Incident(
+                title="Cache Down",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+            ),
         )
         tag_api = Tag.objects.create(name="API", type=TagType.AFFECTED_SERVICE)
         tag_db = Tag.objects.create(name="Database", type=TagType.AFFECTED_SERVICE)
@@ -363,7 +359,6 @@ class TestUIIncidentFilters:
         inc2.affected_service_tags.add(tag_db)
         inc3.affected_service_tags.add(tag_cache)
 
-        self.client.force_authenticate(user=self.user)
         response = self.client.get(
             "/api/ui/incidents/?affected_service=API&affected_service=Database"
         )
@@ -371,16 +366,18 @@ class TestUIIncidentFilters:
         assert response.status_code == 200
         assert response.data["count"] == 2
 
-    def test_filter_by_tags_across_types(self):
-        inc1 = Incident.objects.create(
-            title="API OOM",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-        )
-        inc2 = Incident.objects.create(
-            title="API Config",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
+    def test_filter_by_tags_across_types(self, bulk_create_incidents):
+        inc1, inc2 = bulk_create_incidents(
+            Incident(
+                title="API OOM",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+            ),
+            Incident(
+                title="API Config",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+            ),
         )
         tag_api = Tag.objects.create(name="API", type=TagType.AFFECTED_SERVICE)
         tag_oom = Tag.objects.create(name="OOM", type=TagType.ROOT_CAUSE)
@@ -390,7 +387,6 @@ class TestUIIncidentFilters:
         inc2.affected_service_tags.add(tag_api)
         inc2.root_cause_tags.add(tag_config)
 
-        self.client.force_authenticate(user=self.user)
         response = self.client.get(
             "/api/ui/incidents/?affected_service=API&root_cause=OOM"
         )
@@ -399,54 +395,56 @@ class TestUIIncidentFilters:
         assert response.data["count"] == 1
         assert response.data["results"][0]["title"] == "API OOM"
 
-    def test_filter_by_service_tier(self):
-        Incident.objects.create(
-            title="T0 Incident",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-            service_tier=ServiceTier.T0,
-        )
-        Incident.objects.create(
-            title="T1 Incident",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P2,
-            service_tier=ServiceTier.T1,
+    def test_filter_by_service_tier(self, bulk_create_incidents):
+        bulk_create_incidents(
+            Incident(
+                title="T0 Incident",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+                service_tier=ServiceTier.T0,
+            ),
+            Incident(
+                title="T1 Incident",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P2,
+                service_tier=ServiceTier.T1,
+            ),
         )
 
-        self.client.force_authenticate(user=self.user)
         response = self.client.get("/api/ui/incidents/?service_tier=T0")
 
         assert response.status_code == 200
         assert response.data["count"] == 1
         assert response.data["results"][0]["title"] == "T0 Incident"
 
-    def test_filter_by_multiple_service_tiers(self):
-        Incident.objects.create(
-            title="T0 Incident",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-            service_tier=ServiceTier.T0,
-        )
-        Incident.objects.create(
-            title="T1 Incident",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P2,
-            service_tier=ServiceTier.T1,
-        )
-        Incident.objects.create(
-            title="T2 Incident",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P3,
-            service_tier=ServiceTier.T2,
+    def test_filter_by_multiple_service_tiers(self, bulk_create_incidents):
+        bulk_create_incidents(
+            Incident(
+                title="T0 Incident",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+                service_tier=ServiceTier.T0,
+            ),
+            Incident(
+                title="T1 Incident",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P2,
+                service_tier=ServiceTier.T1,
+            ),
+            Incident(
+                title="T2 Incident",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P3,
+                service_tier=ServiceTier.T2,
+            ),
         )
 
-        self.client.force_authenticate(user=self.user)
         response = self.client.get("/api/ui/incidents/?service_tier=T0&service_tier=T1")
 
         assert response.status_code == 200
         assert response.data["count"] == 2
 
-    def test_filter_by_captain(self):
+    def test_filter_by_captain(self, bulk_create_incidents):
         captain1 = User.objects.create_user(
             username="captain1@example.com",
             email="captain1@example.com",
@@ -455,27 +453,28 @@ class TestUIIncidentFilters:
             username="captain2@example.com",
             email="captain2@example.com",
         )
-        Incident.objects.create(
-            title="Captain1 Incident",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-            captain=captain1,
-        )
-        Incident.objects.create(
-            title="Captain2 Incident",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-            captain=captain2,
+        bulk_create_incidents(
+            Incident(
+                title="Captain1 Incident",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+                captain=captain1,
+            ),
+            Incident(
+                title="Captain2 Incident",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+                captain=captain2,
+            ),
         )
 
-        self.client.force_authenticate(user=self.user)
         response = self.client.get("/api/ui/incidents/?captain=captain1@example.com")
 
         assert response.status_code == 200
         assert response.data["count"] == 1
         assert response.data["results"][0]["title"] == "Captain1 Incident"
 
-    def test_filter_by_reporter(self):
+    def test_filter_by_reporter(self, bulk_create_incidents):
         reporter1 = User.objects.create_user(
             username="reporter1@example.com",
             email="reporter1@example.com",
@@ -484,27 +483,28 @@ class TestUIIncidentFilters:
             username="reporter2@example.com",
             email="reporter2@example.com",
         )
-        Incident.objects.create(
-            title="Reporter1 Incident",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-            reporter=reporter1,
-        )
-        Incident.objects.create(
-            title="Reporter2 Incident",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-            reporter=reporter2,
+        bulk_create_incidents(
+            Incident(
+                title="Reporter1 Incident",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+                reporter=reporter1,
+            ),
+            Incident(
+                title="Reporter2 Incident",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+                reporter=reporter2,
+            ),
         )
 
-        self.client.force_authenticate(user=self.user)
         response = self.client.get("/api/ui/incidents/?reporter=reporter1@example.com")
 
         assert response.status_code == 200
         assert response.data["count"] == 1
         assert response.data["results"][0]["title"] == "Reporter1 Incident"
 
-    def test_filter_by_participant(self):
+    def test_filter_by_participant(self, bulk_create_incidents):
         participant1 = User.objects.create_user(
             username="participant1@example.com",
             email="participant1@example.com",
@@ -513,20 +513,21 @@ class TestUIIncidentFilters:
             username="participant2@example.com",
             email="participant2@example.com",
         )
-        incident1 = Incident.objects.create(
-            title="Participant1 Incident",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-        )
-        incident2 = Incident.objects.create(
-            title="Participant2 Incident",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
+        incident1, incident2 = bulk_create_incidents(
+            Incident(
+                title="Participant1 Incident",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+            ),
+            Incident(
+                title="Participant2 Incident",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+            ),
         )
         incident1.participants.add(participant1)
         incident2.participants.add(participant2)
 
-        self.client.force_authenticate(user=self.user)
         response = self.client.get(
             "/api/ui/incidents/?participant=participant1@example.com"
         )
@@ -551,7 +552,6 @@ class TestUIIncidentFilters:
         )
         incident.participants.add(participant1, participant2)
 
-        self.client.force_authenticate(user=self.user)
         response = self.client.get(
             "/api/ui/incidents/?participant=participant1@example.com"
             "&participant=participant2@example.com"
@@ -578,61 +578,62 @@ class TestUIIncidentFilters:
             severity=IncidentSeverity.P1,
         )
 
-        self.client.force_authenticate(user=self.user)
         response = self.client.get("/api/ui/incidents/?participant=__empty__")
 
         assert response.status_code == 200
         assert response.data["count"] == 1
         assert response.data["results"][0]["title"] == "No Participants"
 
-    def test_filter_by_empty_captain(self):
+    def test_filter_by_empty_captain(self, bulk_create_incidents):
         captain = User.objects.create_user(
             username="captain@example.com",
             email="captain@example.com",
         )
-        Incident.objects.create(
-            title="With Captain",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-            captain=captain,
-        )
-        Incident.objects.create(
-            title="No Captain",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
+        bulk_create_incidents(
+            Incident(
+                title="With Captain",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+                captain=captain,
+            ),
+            Incident(
+                title="No Captain",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+            ),
         )
 
-        self.client.force_authenticate(user=self.user)
         response = self.client.get("/api/ui/incidents/?captain=__empty__")
 
         assert response.status_code == 200
         assert response.data["count"] == 1
         assert response.data["results"][0]["title"] == "No Captain"
 
-    def test_filter_by_empty_and_value_captain(self):
+    def test_filter_by_empty_and_value_captain(self, bulk_create_incidents):
         captain = User.objects.create_user(
             username="captain@example.com",
             email="captain@example.com",
         )
-        Incident.objects.create(
-            title="With Captain",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-            captain=captain,
-        )
-        Incident.objects.create(
-            title="No Captain",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-        )
-        Incident.objects.create(
-            title="Other Captain",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-            captain=self.user,
+        bulk_create_incidents(
+            Incident(
+                title="With Captain",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+                captain=captain,
+            ),
+            Incident(
+                title="No Captain",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+            ),
+            Incident(
+                title="Other Captain",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+                captain=self.user,
+            ),
         )
 
-        self.client.force_authenticate(user=self.user)
         response = self.client.get(
             "/api/ui/incidents/?captain=__empty__&captain=captain@example.com"
         )
@@ -642,70 +643,73 @@ class TestUIIncidentFilters:
         titles = {r["title"] for r in response.data["results"]}
         assert titles == {"With Captain", "No Captain"}
 
-    def test_filter_by_empty_reporter(self):
+    def test_filter_by_empty_reporter(self, bulk_create_incidents):
         reporter = User.objects.create_user(
             username="reporter@example.com",
             email="reporter@example.com",
         )
-        Incident.objects.create(
-            title="With Reporter",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-            reporter=reporter,
-        )
-        Incident.objects.create(
-            title="No Reporter",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
+        bulk_create_incidents(
+            Incident(
+                title="With Reporter",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+                reporter=reporter,
+            ),
+            Incident(
+                title="No Reporter",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+            ),
         )
 
-        self.client.force_authenticate(user=self.user)
         response = self.client.get("/api/ui/incidents/?reporter=__empty__")
 
         assert response.status_code == 200
         assert response.data["count"] == 1
         assert response.data["results"][0]["title"] == "No Reporter"
 
-    def test_filter_by_empty_service_tier(self):
-        Incident.objects.create(
-            title="With Tier",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-            service_tier=ServiceTier.T0,
-        )
-        Incident.objects.create(
-            title="No Tier",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
+    def test_filter_by_empty_service_tier(self, bulk_create_incidents):
+        bulk_create_incidents(
+            Incident(
+                title="With Tier",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+                service_tier=ServiceTier.T0,
+            ),
+            Incident(
+                title="No Tier",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+            ),
         )
 
-        self.client.force_authenticate(user=self.user)
         response = self.client.get("/api/ui/incidents/?service_tier=__empty__")
 
         assert response.status_code == 200
         assert response.data["count"] == 1
         assert response.data["results"][0]["title"] == "No Tier"
 
-    def test_filter_by_empty_and_value_service_tier(self):
-        Incident.objects.create(
-            title="T0 Incident",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-            service_tier=ServiceTier.T0,
-        )
-        Incident.objects.create(
-            title="T1 Incident",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-            service_tier=ServiceTier.T1,
-        )
-        Incident.objects.create(
-            title="No Tier",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
+    def test_filter_by_empty_and_value_service_tier(self, bulk_create_incidents):
+        bulk_create_incidents(
+            Incident(
+                title="T0 Incident",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+                service_tier=ServiceTier.T0,
+            ),
+            Incident(
+                title="T1 Incident",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+                service_tier=ServiceTier.T1,
+            ),
+            Incident(
+                title="No Tier",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+            ),
         )
 
-        self.client.force_authenticate(user=self.user)
         response = self.client.get(
             "/api/ui/incidents/?service_tier=__empty__&service_tier=T0"
         )
@@ -715,49 +719,51 @@ class TestUIIncidentFilters:
         titles = {r["title"] for r in response.data["results"]}
         assert titles == {"T0 Incident", "No Tier"}
 
-    def test_filter_by_empty_tag(self):
-        inc_with_tag = Incident.objects.create(
-            title="With Service",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-        )
-        Incident.objects.create(
-            title="No Service",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
+    def test_filter_by_empty_tag(self, bulk_create_incidents):
+        inc_with_tag, _ = bulk_create_incidents(
+            Incident(
+                title="With Service",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+            ),
+            Incident(
+                title="No Service",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+            ),
         )
         tag = Tag.objects.create(name="API", type=TagType.AFFECTED_SERVICE)
         inc_with_tag.affected_service_tags.add(tag)
 
-        self.client.force_authenticate(user=self.user)
         response = self.client.get("/api/ui/incidents/?affected_service=__empty__")
 
         assert response.status_code == 200
         assert response.data["count"] == 1
         assert response.data["results"][0]["title"] == "No Service"
 
-    def test_filter_by_empty_and_value_tag(self):
-        inc_with_tag = Incident.objects.create(
-            title="With Service",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-        )
-        Incident.objects.create(
-            title="No Service",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-        )
-        inc_other = Incident.objects.create(
-            title="Other Service",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
+    def test_filter_by_empty_and_value_tag(self, bulk_create_incidents):
+        inc_with_tag, _, inc_other = bulk_create_incidents(
+            Incident(
+                title="With Service",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+            ),
+            Incident(
+                title="No Service",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+            ),
+            Incident(
+                title="Other Service",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+            ),
         )
         api_tag = Tag.objects.create(name="API", type=TagType.AFFECTED_SERVICE)
         web_tag = Tag.objects.create(name="Web", type=TagType.AFFECTED_SERVICE)
         inc_with_tag.affected_service_tags.add(api_tag)
         inc_other.affected_service_tags.add(web_tag)
 
-        self.client.force_authenticate(user=self.user)
         response = self.client.get(
             "/api/ui/incidents/?affected_service=__empty__&affected_service=API"
         )
@@ -787,27 +793,24 @@ class TestServiceAPIIncidentFilters:
             email="reporter@example.com",
             password="testpass123",
         )
-
-    def test_filter_by_date_range(self):
-        inc1 = Incident.objects.create(
-            title="Old Incident",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-        )
-        inc2 = Incident.objects.create(
-            title="New Incident",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-        )
-        Incident.objects.filter(pk=inc1.pk).update(
-            created_at=django_timezone.make_aware(datetime(2024, 1, 1, 0, 0, 0))
-        )
-        Incident.objects.filter(pk=inc2.pk).update(
-            created_at=django_timezone.make_aware(datetime(2024, 6, 15, 12, 0, 0))
-        )
-
         self.client.force_authenticate(user=self.user)
 
+    def test_filter_by_date_range(self, bulk_create_incidents):
+        inc1, inc2 = bulk_create_incidents(
+            Incident(
+                title="Old Incident",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+            ),
+            Incident(
+                title="New Incident",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+            ),
+        )
+        Incident.objects.filter(pk=inc1.pk).update(created_at=JAN_1_2024)
+        Incident.objects.filter(pk=inc2.pk).update(created_at=JUN_15_2024)
+
         response = self.client.get("/api/incidents/?created_after=2024-06-01")
         assert response.status_code == 200
         assert response.data["count"] == 1
@@ -825,25 +828,24 @@ class TestServiceAPIIncidentFilters:
         assert response.data["count"] == 1
 
     def test_invalid_date_format(self):
-        self.client.force_authenticate(user=self.user)
-
         response = self.client.get("/api/incidents/?created_after=invalid")
         assert response.status_code == 400
         assert "created_after" in response.data
 
-    def test_filter_by_severity(self):
-        Incident.objects.create(
-            title="P1 Incident",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-        )
-        Incident.objects.create(
-            title="P2 Incident",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P2,
+    def test_filter_by_severity(self, bulk_create_incidents):
+        bulk_create_incidents(
+            Incident(
+                title="P1 Incident",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+            ),
+            Incident(
+                title="P2 Incident",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P2,
+            ),
         )
 
-        self.client.force_authenticate(user=self.user)
         response = self.client.get("/api/incidents/?severity=P1")
 
         assert response.status_code == 200
@@ -851,24 +853,25 @@ class TestServiceAPIIncidentFilters:
         assert len(response.data["results"]) == 1
         assert response.data["results"][0]["title"] == "P1 Incident"
 
-    def test_filter_by_multiple_severities(self):
-        Incident.objects.create(
-            title="P1 Incident",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-        )
-        Incident.objects.create(
-            title="P2 Incident",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P2,
-        )
-        Incident.objects.create(
-            title="P3 Incident",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P3,
+    def test_filter_by_multiple_severities(self, bulk_create_incidents):
+        bulk_create_incidents(
+            Incident(
+                title="P1 Incident",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+            ),
+            Incident(
+                title="P2 Incident",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P2,
+            ),
+            Incident(
+                title="P3 Incident",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P3,
+            ),
         )
 
-        self.client.force_authenticate(user=self.user)
         response = self.client.get("/api/incidents/?severity=P1&severity=P2")
 
         assert response.status_code == 200
@@ -876,39 +879,33 @@ class TestServiceAPIIncidentFilters:
         assert len(response.data["results"]) == 2
 
     def test_invalid_severity(self):
-        self.client.force_authenticate(user=self.user)
-
         response = self.client.get("/api/incidents/?severity=InvalidSeverity")
         assert response.status_code == 400
         assert "severity" in response.data
 
-    def test_filter_by_severity_and_date(self):
-        Incident.objects.create(
-            title="P1 Old",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-        )
-        Incident.objects.create(
-            title="P1 New",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-        )
-        Incident.objects.create(
-            title="P2 Old",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P2,
-        )
-        Incident.objects.filter(pk=Incident.objects.get(title="P1 Old").pk).update(
-            created_at=django_timezone.make_aware(datetime(2024, 1, 1, 0, 0, 0))
-        )
-        Incident.objects.filter(pk=Incident.objects.get(title="P2 Old").pk).update(
-            created_at=django_timezone.make_aware(datetime(2024, 1, 1, 0, 0, 0))
-        )
-        Incident.objects.filter(pk=Incident.objects.get(title="P1 New").pk).update(
-            created_at=django_timezone.make_aware(datetime(2024, 6, 15, 12, 0, 0))
-        )
+    def test_filter_by_severity_and_date(self, bulk_create_incidents):
+        p1_old, p1_new, p2_old = bulk_create_incidents(
+            Incident(
+                title="P1 Old",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+            ),
+            Incident(
+                title="P1 New",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+            ),
+            Incident(
+                title="P2 Old",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P2,
+            ),
+        )
+        Incident.objects.filter(pk__in=[p1_old.pk, p2_old.pk]).update(
+            created_at=JAN_1_2024
+        )
+        Incident.objects.filter(pk=p1_new.pk).update(created_at=JUN_15_2024)
 
-        self.client.force_authenticate(user=self.user)
         response = self.client.get(
             "/api/incidents/?severity=P1&created_after=2024-01-01"
         )
@@ -917,39 +914,42 @@ class TestServiceAPIIncidentFilters:
         assert response.data["count"] == 2
         assert len(response.data["results"]) == 2
 
-    def test_filter_by_tag(self):
-        inc1 = Incident.objects.create(
-            title="API Down",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-        )
-        inc2 = Incident.objects.create(
-            title="DB Down",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
+    def test_filter_by_tag(self, bulk_create_incidents):
+        inc1, inc2 = bulk_create_incidents(
+            Incident(
+                title="API Down",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+            ),
+            Incident(
+                title="DB Down",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+            ),
         )
         tag_api = Tag.objects.create(name="API", type=TagType.AFFECTED_SERVICE)
         tag_db = Tag.objects.create(name="Database", type=TagType.AFFECTED_SERVICE)
         inc1.affected_service_tags.add(tag_api)
         inc2.affected_service_tags.add(tag_db)
 
-        self.client.force_authenticate(user=self.user)
         response = self.client.get("/api/incidents/?affected_service=API")
 
         assert response.status_code == 200
         assert response.data["count"] == 1
         assert response.data["results"][0]["title"] == "API Down"
 
-    def test_filter_by_tags_across_types(self):
-        inc1 = Incident.objects.create(
-            title="API OOM",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-        )
-        inc2 = Incident.objects.create(
-            title="API Config",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
+    def test_filter_by_tags_across_types(self, bulk_create_incidents):
+        inc1, inc2 = bulk_create_incidents(
+            Incident(
+                title="API OOM",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+            ),
+            Incident(
+                title="API Config",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+            ),
         )
         tag_api = Tag.objects.create(name="API", type=TagType.AFFECTED_SERVICE)
         tag_oom = Tag.objects.create(name="OOM", type=TagType.ROOT_CAUSE)
@@ -959,7 +959,6 @@ class TestServiceAPIIncidentFilters:
         inc2.affected_service_tags.add(tag_api)
         inc2.root_cause_tags.add(tag_config)
 
-        self.client.force_authenticate(user=self.user)
         response = self.client.get(
             "/api/incidents/?affected_service=API&root_cause=OOM"
         )
@@ -968,19 +967,20 @@ class TestServiceAPIIncidentFilters:
         assert response.data["count"] == 1
         assert response.data["results"][0]["title"] == "API OOM"
 
-    def test_filter_by_status(self):
-        Incident.objects.create(
-            title="Active Incident",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-        )
-        Incident.objects.create(
-            title="Done Incident",
-            status=IncidentStatus.DONE,
-            severity=IncidentSeverity.P1,
+    def test_filter_by_status(self, bulk_create_incidents):
+        bulk_create_incidents(
+            Incident(
+                title="Active Incident",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+            ),
+            Incident(
+                title="Done Incident",
+                status=IncidentStatus.DONE,
+                severity=IncidentSeverity.P1,
+            ),
         )
 
-        self.client.force_authenticate(user=self.user)
         response = self.client.get("/api/incidents/?status=Active")
 
         assert response.status_code == 200
@@ -988,76 +988,75 @@ class TestServiceAPIIncidentFilters:
         assert response.data["results"][0]["title"] == "Active Incident"
 
     def test_invalid_status(self):
-        self.client.force_authenticate(user=self.user)
-
         response = self.client.get("/api/incidents/?status=InvalidStatus")
         assert response.status_code == 400
         assert "status" in response.data
 
     def test_invalid_service_tier(self):
-        self.client.force_authenticate(user=self.user)
-
         response = self.client.get("/api/incidents/?service_tier=InvalidTier")
         assert response.status_code == 400
         assert "service_tier" in response.data
 
-    def test_filter_by_service_tier(self):
-        Incident.objects.create(
-            title="T0 Incident",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-            service_tier=ServiceTier.T0,
-        )
-        Incident.objects.create(
-            title="T1 Incident",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-            service_tier=ServiceTier.T1,
+    def test_filter_by_service_tier(self, bulk_create_incidents):
+        bulk_create_incidents(
+            Incident(
+                title="T0 Incident",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+                service_tier=ServiceTier.T0,
+            ),
+            Incident(
+                title="T1 Incident",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+                service_tier=ServiceTier.T1,
+            ),
         )
 
-        self.client.force_authenticate(user=self.user)
         response = self.client.get("/api/incidents/?service_tier=T0")
 
         assert response.status_code == 200
         assert response.data["count"] == 1
         assert response.data["results"][0]["title"] == "T0 Incident"
 
-    def test_filter_by_captain(self):
-        Incident.objects.create(
-            title="Captain Incident",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-            captain=self.captain,
-        )
-        Incident.objects.create(
-            title="Other Incident",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-            captain=self.reporter,
+    def test_filter_by_captain(self, bulk_create_incidents):
+        bulk_create_incidents(
+            Incident(
+                title="Captain Incident",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+                captain=self.captain,
+            ),
+            Incident(
+                title="Other Incident",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+                captain=self.reporter,
+            ),
         )
 
-        self.client.force_authenticate(user=self.user)
         response = self.client.get("/api/incidents/?captain=captain@example.com")
 
         assert response.status_code == 200
         assert response.data["count"] == 1
         assert response.data["results"][0]["title"] == "Captain Incident"
 
-    def test_filter_by_reporter(self):
-        Incident.objects.create(
-            title="Reporter Incident",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-            reporter=self.reporter,
-        )
-        Incident.objects.create(
-            title="Other Incident",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-            reporter=self.captain,
+    def test_filter_by_reporter(self, bulk_create_incidents):
+        bulk_create_incidents(
+            Incident(
+                title="Reporter Incident",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+                reporter=self.reporter,
+            ),
+            Incident(
+                title="Other Incident",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+                reporter=self.captain,
+            ),
         )
 
-        self.client.force_authenticate(user=self.user)
         response = self.client.get("/api/incidents/?reporter=reporter@example.com")
 
         assert response.status_code == 200
@@ -1077,7 +1076,6 @@ class TestServiceAPIIncidentFilters:
             severity=IncidentSeverity.P1,
         )
 
-        self.client.force_authenticate(user=self.user)
         response = self.client.get("/api/incidents/?participant=reporter@example.com")
 
         assert response.status_code == 200
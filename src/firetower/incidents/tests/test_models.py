@@ -132,29 +132,8 @@ class TestIncident:
             title="Second", status=IncidentStatus.ACTIVE, severity=IncidentSeverity.P1
         )
 
-        incidents = list(Incident.objects.all())
-        assert incidents[0] == incident2  # Most recent first
-        assert incidents[1] == incident1
-
-    def test_incident_validation_empty_title(self):
-        """Test that empty title raises validation error"""
-        incident = Incident(
-            title="", status=IncidentStatus.ACTIVE, severity=IncidentSeverity.P1
-        )
-
-        with pytest.raises(ValidationError) as exc_info:
-            incident.save()
-
-        assert "title" in exc_info.value.message_dict
-
-    def test_incident_validation_missing_severity(self):
-        """Test that missing severity raises validation error"""
-        incident = Incident(title="Test", status=IncidentStatus.ACTIVE)
-
-        with pytest.raises(ValidationError) as exc_info:
-            incident.save()
-
-        assert "severity" in exc_info.value.message_dict
+        ids = list(Incident.objects.values_list("id", flat=True))
+        assert ids == [incident2.id, incident1.id]  # Most recent first
 
     def test_public_incident_visible_to_all(self):
         """Test public incident is visible to everyone"""
@@ -169,25 +148,12 @@ class TestIncident:
 
         assert incident.is_visible_to_user(user) is True
 
-    def test_private_incident_visible_to_captain(self):
-        """Test private incident is visible to captain"""
-        captain = User.objects.create_user(username="captain@example.com")
-        other_user = User.objects.create_user(username="other@example.com")
-
-        incident = Incident.objects.create(
-            title="Private Incident",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-            is_private=True,
-            captain=captain,
-        )
-
-        assert incident.is_visible_to_user(captain) is True
-        assert incident.is_visible_to_user(other_user) is False
-
-    def test_private_incident_visible_to_reporter(self):
-        """Test private incident is visible to reporter"""
-        reporter = User.objects.create_user(username="reporter@example.com")
+    @pytest.mark.parametrize("role", ["captain", "reporter"])
+    def test_private_incident_visible_to_captain_or_reporter(
+        self, django_assert_num_queries, role
+    ):
+        """Test private incident is visible to its captain and reporter"""
+        involved = User.objects.create_user(username=f"{role}@example.com")
         other_user = User.objects.create_user(username="other@example.com")
 
         incident = Incident.objects.create(
@@ -195,13 +161,16 @@ class TestIncident:
             status=IncidentStatus.ACTIVE,
             severity=IncidentSeverity.P1,
             is_private=True,
-            reporter=reporter,
+            **{role: involved},
         )
 
-        assert incident.is_visible_to_user(reporter) is True
-        assert incident.is_visible_to_user(other_user) is False
+        # The involved user is cached on the instance, so only the participant
+        # lookup for other_user reaches the database
+        with django_assert_num_queries(1):
+            assert incident.is_visible_to_user(involved) is True
+            assert incident.is_visible_to_user(other_user) is False
 
-    def test_private_incident_visible_to_participant(self):
+    def test_private_incident_visible_to_participant(self, django_assert_num_queries):
         """Test private incident is visible to participant"""
         participant = User.objects.create_user(username="participant@example.com")
         other_user = User.objects.create_user(username="other@example.com")
@@ -214,15 +183,16 @@ class TestIncident:
         )
         incident.participants.add(participant)
 
-        assert incident.is_visible_to_user(participant) is True
-        assert incident.is_visible_to_user(other_user) is False
+        # No captain or reporter to load, so each check is a single EXISTS query
+        with django_assert_num_queries(2):
+            assert incident.is_visible_to_user(participant) is True
+            assert incident.is_visible_to_user(other_user) is False
 
     def test_private_incident_not_visible_to_superuser(self):
         """Test private incident is not visible to uninvolved superusers"""
         superuser = User.objects.create_superuser(
             username="superuser@example.com",
             email="superuser@example.com",
-            password="test123",
         )
 
         incident = Incident.objects.create(
@@ -234,42 +204,43 @@ class TestIncident:
 
         assert incident.is_visible_to_user(superuser) is False
 
-    def test_private_incident_visible_to_involved_superuser(self):
+    def test_private_incident_visible_to_involved_superuser(
+        self, bulk_create_incidents
+    ):
         """Test private incident is visible to superusers who are captain, reporter, or participant"""
         superuser = User.objects.create_superuser(
             username="superuser@example.com",
             email="superuser@example.com",
-            password="test123",
         )
 
-        # Visible as captain
-        incident_captain = Incident.objects.create(
-            title="Private Captain",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-            is_private=True,
-            captain=superuser,
+        incident_captain, incident_reporter, incident_participant = (
+            bulk_create_incidents(
+                Incident(
+                    title="Private Captain",
+                    status=IncidentStatus.ACTIVE,
+                    severity=IncidentSeverity.P1,
+                    is_private=True,
+                    captain=superuser,
+                ),
+                Incident(
+                    title="Private Reporter",
+                    status=IncidentStatus.ACTIVE,
+                    severity=IncidentSeverity.P1,
+                    is_private=True,
+                    reporter=superuser,
+                ),
+                Incident(
+                    title="Private Participant",
+                    status=IncidentStatus.ACTIVE,
+                    severity=IncidentSeverity.P1,
+                    is_private=True,
+                ),
+            )
         )
-        assert incident_captain.is_visible_to_user(superuser) is True
+        incident_participant.participants.add(superuser)
 
-        # Visible as reporter
-        incident_reporter = Incident.objects.create(
-            title="Private Reporter",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-            is_private=True,
-            reporter=superuser,
-        )
+        assert incident_captain.is_visible_to_user(superuser) is True
         assert incident_reporter.is_visible_to_user(superuser) is True
-
-        # Visible as participant
-        incident_participant = Incident.objects.create(
-            title="Private Participant",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-            is_private=True,
-        )
-        incident_participant.participants.add(superuser)
         assert incident_participant.is_visible_to_user(superuser) is True
 
     def test_affected_service_tag_names_property(self):
@@ -304,7 +275,7 @@ class TestIncident:
         assert "Resource Exhaustion" in names
         assert "Traffic Spike" in names
 
-    def test_external_links_dict_property(self):
+    def test_external_links_dict_property(self, django_assert_num_queries):
         """Test external_links_dict property returns dict with lowercase keys"""
         incident = Incident.objects.create(
             title="Test", status=IncidentStatus.ACTIVE, severity=IncidentSeverity.P1
@@ -316,7 +287,8 @@ class TestIncident:
             url="https://slack.com/channel",
         )
 
-        links = incident.external_links_dict
+        with django_assert_num_queries(1):
+            links = incident.external_links_dict
 
         # Should only include existing links (no nulls)
         assert "slack" in links
@@ -325,6 +297,50 @@ class TestIncident:
         assert "datadog" not in links
         assert len(links) == 1
 
+    def test_external_links_dict_uses_prefetched_links(self, django_assert_num_queries):
+        """Test external_links_dict reads prefetched links without querying"""
+        incident = Incident.objects.create(
+            title="Test", status=IncidentStatus.ACTIVE, severity=IncidentSeverity.P1
+        )
+        ExternalLink.objects.create(
+            incident=incident, type=ExternalLinkType.SLACK, url="https://slack.com"
+        )
+        ExternalLink.objects.create(
+            incident=incident, type=ExternalLinkType.LINEAR, url="https://linear.app"
+        )
+
+        incident = Incident.objects.prefetch_related("external_links").get(
+            id=incident.id
+        )
+
+        with django_assert_num_queries(0):
+            links = incident.external_links_dict
+
+        assert links == {"slack": "https://slack.com", "linear": "https://linear.app"}
+
+
+class TestIncidentValidation:
+    def test_incident_validation_empty_title(self):
+        """Test that empty title raises validation error"""
+        incident = Incident(
+            title="", status=IncidentStatus.ACTIVE, severity=IncidentSeverity.P1
+        )
+
+        # The id is assigned from IncidentCounter on save, so leave it out here
+        with pytest.raises(ValidationError) as exc_info:
+            incident.full_clean(exclude=["id"])
+
+        assert set(exc_info.value.message_dict) == {"title"}
+
+    def test_incident_validation_missing_severity(self):
+        """Test that missing severity raises validation error"""
+        incident = Incident(title="Test", status=IncidentStatus.ACTIVE)
+
+        with pytest.raises(ValidationError) as exc_info:
+            incident.full_clean(exclude=["id"])
+
+        assert set(exc_info.value.message_dict) == {"severity"}
+
 
 @pytest.mark.django_db
 class TestTag:
@@ -368,9 +384,11 @@ class TestTag:
 
     def test_tag_ordering(self):
         """Test tags are ordered alphabetically by name"""
-        Tag.objects.create(name="Zebra", type=TagType.AFFECTED_SERVICE)
-        Tag.objects.create(name="Apple", type=TagType.AFFECTED_SERVICE)
-        Tag.objects.create(name="Banana", type=TagType.AFFECTED_SERVICE)
+        # Only Meta.ordering is under test, so skip save() validation
+        Tag.objects.bulk_create(
+            Tag(name=name, type=TagType.AFFECTED_SERVICE)
+            for name in ("Zebra", "Apple", "Banana")
+        )
 
         tags = list(Tag.objects.all())
         assert tags[0].name == "Apple"
@@ -386,12 +404,15 @@ class TestTag:
 
 @pytest.mark.django_db
 class TestExternalLink:
-    def test_external_link_creation(self):
-        """Test creating external link"""
-        incident = Incident.objects.create(
+    @pytest.fixture
+    def incident(self):
+        """Create an incident to attach links to."""
+        return Incident.objects.create(
             title="Test", status=IncidentStatus.ACTIVE, severity=IncidentSeverity.P1
         )
 
+    def test_external_link_creation(self, incident):
+        """Test creating external link"""
         link = ExternalLink.objects.create(
             incident=incident,
             type=ExternalLinkType.SLACK,
@@ -403,12 +424,8 @@ class TestExternalLink:
         assert link.url == "https://slack.com/channel"
         assert link.created_at is not None
 
-    def test_external_link_unique_together(self):
+    def test_external_link_unique_together(self, incident):
         """Test incident can only have one link per type"""
-        incident = Incident.objects.create(
-            title="Test", status=IncidentStatus.ACTIVE, severity=IncidentSeverity.P1
-        )
-
         ExternalLink.objects.create(
             incident=incident,
             type=ExternalLinkType.SLACK,
@@ -422,12 +439,8 @@ class TestExternalLink:
                 url="https://slack.com/channel2",
             )
 
-    def test_external_link_multiple_types(self):
+    def test_external_link_multiple_types(self, incident):
         """Test incident can have multiple links of different types"""
-        incident = Incident.objects.create(
-            title="Test", status=IncidentStatus.ACTIVE, severity=IncidentSeverity.P1
-        )
-
         slack = ExternalLink.objects.create(
             incident=incident, type=ExternalLinkType.SLACK, url="https://slack.com"
         )
@@ -440,12 +453,8 @@ class TestExternalLink:
         assert slack in incident.external_links.all()
         assert linear in incident.external_links.all()
 
-    def test_external_link_str(self):
+    def test_external_link_str(self, incident):
         """Test external link string representation"""
-        incident = Incident.objects.create(
-            title="Test", status=IncidentStatus.ACTIVE, severity=IncidentSeverity.P1
-        )
-
         link = ExternalLink.objects.create(
             incident=incident, type=ExternalLinkType.SLACK, url="https://slack.com"
         )
@@ -455,94 +464,124 @@ class TestExternalLink:
 
 @pytest.mark.django_db
 class TestFilterVisibleToUser:
-    def test_superuser_cannot_see_private_incidents(self):
+    def test_superuser_cannot_see_private_incidents(
+        self, bulk_create_incidents, django_assert_num_queries
+    ):
         """Test superusers cannot see private incidents they are not involved in"""
         superuser = User.objects.create_superuser(
             username="superuser@example.com",
             email="superuser@example.com",
-            password="test123",
         )
 
-        public = Incident.objects.create(
-            title="Public",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-            is_private=False,
-        )
-
-        Incident.objects.create(
-            title="Private",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-            is_private=True,
+        public, _ = bulk_create_incidents(
+            Incident(
+                title="Public",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+                is_private=False,
+            ),
+            Incident(
+                title="Private",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+                is_private=True,
+            ),
         )
 
-        queryset = Incident.objects.all()
-        filtered = filter_visible_to_user(queryset, superuser)
+        with django_assert_num_queries(1):
+            filtered = list(filter_visible_to_user(Incident.objects.all(), superuser))
 
-        assert filtered.count() == 1
+        assert len(filtered) == 1
         assert public in filtered
 
-    def test_regular_user_sees_public_and_own_private(self):
+    def test_regular_user_sees_public_and_own_private(
+        self, bulk_create_incidents, django_assert_num_queries
+    ):
         """Test regular users see public incidents and their own private ones"""
         user = User.objects.create_user(username="user@example.com")
         other_user = User.objects.create_user(username="other@example.com")
 
-        public = Incident.objects.create(
-            title="Public",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-            is_private=False,
-        )
-
-        user_private = Incident.objects.create(
-            title="User Private",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-            is_private=True,
-            captain=user,
-        )
-
-        other_private = Incident.objects.create(
-            title="Other Private",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-            is_private=True,
-            captain=other_user,
+        public, user_private, other_private = bulk_create_incidents(
+            Incident(
+                title="Public",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+                is_private=False,
+            ),
+            Incident(
+                title="User Private",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+                is_private=True,
+                captain=user,
+            ),
+            Incident(
+                title="Other Private",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+                is_private=True,
+                captain=other_user,
+            ),
         )
 
-        queryset = Incident.objects.all()
-        filtered = filter_visible_to_user(queryset, user)
+        with django_assert_num_queries(1):
+            filtered = list(filter_visible_to_user(Incident.objects.all(), user))
 
-        assert filtered.count() == 2
+        assert len(filtered) == 2
         assert public in filtered
         assert user_private in filtered
         assert other_private not in filtered
 
-    def test_participant_sees_private_incident(self):
+    def test_participant_sees_private_incident(
+        self, bulk_create_incidents, django_assert_num_queries
+    ):
         """Test participants can see private incidents they're involved in"""
         participant = User.objects.create_user(username="participant@example.com")
         other_user = User.objects.create_user(username="other@example.com")
 
-        private = Incident.objects.create(
-            title="Private",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-            is_private=True,
+        private, other_private = bulk_create_incidents(
+            Incident(
+                title="Private",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+                is_private=True,
+            ),
+            Incident(
+                title="Other Private",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+                is_private=True,
+                captain=other_user,
+            ),
         )
         private.participants.add(participant)
 
-        other_private = Incident.objects.create(
-            title="Other Private",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-            is_private=True,
-            captain=other_user,
-        )
+        with django_assert_num_queries(1):
+            filtered = list(filter_visible_to_user(Incident.objects.all(), participant))
 
-        queryset = Incident.objects.all()
-        filtered = filter_visible_to_user(queryset, participant)
-
-        assert filtered.count() == 1
+        assert len(filtered) == 1
         assert private in filtered
         assert other_private not in filtered
+
+    def test_incident_listed_once_when_user_has_several_roles(
+        self, bulk_create_incidents
+    ):
+        """Test an incident matching on several roles is only returned once"""
+        user = User.objects.create_user(username="user@example.com")
+        other_user = User.objects.create_user(username="other@example.com")
+
+        (incident,) = bulk_create_incidents(
+            Incident(
+                title="Private",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+                is_private=True,
+                captain=user,
+                reporter=user,
+            )
+        )
+        incident.participants.add(user, other_user)
+
+        filtered = list(filter_visible_to_user(Incident.objects.all(), user))
+
+        assert filtered == [incident]
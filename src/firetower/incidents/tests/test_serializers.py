@@ -19,6 +19,7 @@ from firetower.incidents.serializers import (
     IncidentListUISerializer,
     IncidentWriteSerializer,
 )
+from firetower.incidents.views import IncidentDetailUIView
 
 
 @pytest.mark.django_db
@@ -64,6 +65,29 @@ class TestIncidentListUISerializer:
         assert data["status"] == IncidentStatus.ACTIVE
         assert data["severity"] == IncidentSeverity.P1
 
+    def test_incident_list_serialization_with_captain_selected(
+        self, django_assert_num_queries
+    ):
+        """Test the list serializer only reads what the list view selects"""
+        for name in ("alice", "bob", "carol"):
+            Incident.objects.create(
+                title=f"Incident for {name}",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+                captain=User.objects.create_user(username=f"{name}@example.com"),
+            )
+
+        incidents = list(Incident.objects.select_related("captain"))
+
+        with django_assert_num_queries(0):
+            data = IncidentListUISerializer(incidents, many=True).data
+
+        assert sorted(row["captain"] for row in data) == [
+            "alice@example.com",
+            "bob@example.com",
+            "carol@example.com",
+        ]
+
 
 @pytest.mark.django_db
 class TestIncidentDetailUISerializer:
@@ -148,6 +172,36 @@ class TestIncidentDetailUISerializer:
         assert "linear" not in data["external_links"]  # Not set, so not included
         assert len(data["external_links"]) == 1
 
+    def test_incident_detail_serialization_with_view_queryset(
+        self, django_assert_num_queries
+    ):
+        """Test the detail view's queryset loads everything the serializer reads"""
+        captain = User.objects.create_user(username="captain@example.com")
+        participant = User.objects.create_user(username="participant@example.com")
+
+        incident = Incident.objects.create(
+            title="Test Incident",
+            status=IncidentStatus.ACTIVE,
+            severity=IncidentSeverity.P1,
+            captain=captain,
+        )
+        incident.participants.add(participant)
+        incident.affected_service_tags.add(
+            Tag.objects.create(name="API", type=TagType.AFFECTED_SERVICE)
+        )
+        ExternalLink.objects.create(
+            incident=incident, type=ExternalLinkType.SLACK, url="https://slack.com"
+        )
+
+        incident = IncidentDetailUIView().get_queryset().get(id=incident.id)
+
+        with django_assert_num_queries(0):
+            data = IncidentDetailUISerializer(incident).data
+
+        assert [p["role"] for p in data["participants"]] == ["Captain", "Participant"]
+        assert data["affected_service_tags"] == ["API"]
+        assert data["external_links"] == {"slack": "https://slack.com"}
+
 
 @pytest.mark.django_db
 class TestIncidentWriteSerializerHooks:
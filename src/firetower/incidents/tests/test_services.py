@@ -1,5 +1,5 @@
 from datetime import timedelta
-from unittest.mock import MagicMock, patch
+from unittest.mock import DEFAULT, MagicMock, patch
 
 import pytest
 from django.contrib.auth.models import User
@@ -24,7 +24,17 @@ from firetower.incidents.services import (
 
 @pytest.mark.django_db
 class TestSyncIncidentParticipantsFromSlack:
-    def test_syncs_participants_from_slack_channel(self):
+    @pytest.fixture
+    def mock_slack(self):
+        """Patch the Slack calls the sync makes, keyed by method name."""
+        with patch.multiple(
+            "firetower.incidents.services._slack_service",
+            parse_channel_id_from_url=DEFAULT,
+            get_channel_members=DEFAULT,
+        ) as mocks:
+            yield mocks
+
+    def test_syncs_participants_from_slack_channel(self, mock_slack):
         incident = Incident.objects.create(
             title="Test Incident",
             status=IncidentStatus.ACTIVE,
@@ -62,31 +72,79 @@ class TestSyncIncidentParticipantsFromSlack:
             external_id="U22222",
         )
 
-        with patch(
-            "firetower.incidents.services._slack_service.parse_channel_id_from_url"
-        ) as mock_parse:
-            mock_parse.return_value = "C12345"
+        mock_slack["parse_channel_id_from_url"].return_value = "C12345"
+        mock_slack["get_channel_members"].return_value = ["U11111", "U22222"]
 
-            with patch(
-                "firetower.incidents.services._slack_service.get_channel_members"
-            ) as mock_get_members:
-                mock_get_members.return_value = ["U11111", "U22222"]
+        stats = sync_incident_participants_from_slack(incident)
 
-                stats = sync_incident_participants_from_slack(incident)
+        assert stats.added == 2
+        assert stats.already_existed == 0
+        assert stats.errors == []
+        assert stats.skipped is False
 
-                assert stats.added == 2
-                assert stats.already_existed == 0
-                assert stats.errors == []
-                assert stats.skipped is False
+        assert incident.participants.count() == 3
+        assert slack_user1 in incident.participants.all()
+        assert slack_user2 in incident.participants.all()
+        assert existing_user in incident.participants.all()
 
-                assert incident.participants.count() == 3
-                assert slack_user1 in incident.participants.all()
-                assert slack_user2 in incident.participants.all()
-                assert existing_user in incident.participants.all()
+        assert incident.participants_last_synced_at is not None
+        synced_at = incident.participants_last_synced_at
+        incident.refresh_from_db()
+        assert incident.participants_last_synced_at == synced_at
 
-                assert incident.participants_last_synced_at is not None
+    def test_resolves_known_slack_members_in_one_query(
+        self, mock_slack, django_assert_num_queries
+    ):
+        incident = Incident.objects.create(
+            title="Test Incident",
+            status=IncidentStatus.ACTIVE,
+            severity=IncidentSeverity.P1,
+        )
+        ExternalLink.objects.create(
+            incident=incident,
+            type=ExternalLinkType.SLACK,
+            url="https://workspace.slack.com/archives/C12345",
+        )
 
-    def test_push_only_preserves_existing_participants(self):
+        known_users = []
+        for slack_user_id in ("U11111", "U22222", "U33333"):
+            user = User.objects.create_user(
+                username=f"{slack_user_id}@example.com",
+                email=f"{slack_user_id}@example.com",
+            )
+            ExternalProfile.objects.create(
+                user=user,
+                type=ExternalProfileType.SLACK,
+                external_id=slack_user_id,
+            )
+            known_users.append(user)
+        new_user = User.objects.create_user(
+            username="new@example.com",
+            email="new@example.com",
+        )
+
+        mock_slack["parse_channel_id_from_url"].return_value = "C12345"
+        mock_slack["get_channel_members"].return_value = [
+            "U11111",
+            "U22222",
+            "U33333",
+            "U_NEW",
+        ]
+
+        with patch(
+            "firetower.incidents.services.get_or_create_user_from_slack_id",
+            return_value=new_user,
+        ) as mock_get_user:
+            # Slack link, current participants, Slack profiles, participant
+            # insert and timestamp update, however many members are known
+            with django_assert_num_queries(5):
+                stats = sync_incident_participants_from_slack(incident)
+
+        mock_get_user.assert_called_once_with("U_NEW")
+        assert stats.added == 4
+        assert set(incident.participants.all()) == {*known_users, new_user}
+
+    def test_push_only_preserves_existing_participants(self, mock_slack):
         incident = Incident.objects.create(
             title="Test Incident",
             status=IncidentStatus.ACTIVE,
@@ -114,23 +172,16 @@ class TestSyncIncidentParticipantsFromSlack:
             external_id="U11111",
         )
 
-        with patch(
-            "firetower.incidents.services._slack_service.parse_channel_id_from_url"
-        ) as mock_parse:
-            mock_parse.return_value = "C12345"
-
-            with patch(
-                "firetower.incidents.services._slack_service.get_channel_members"
-            ) as mock_get_members:
-                mock_get_members.return_value = ["U11111"]
+        mock_slack["parse_channel_id_from_url"].return_value = "C12345"
+        mock_slack["get_channel_members"].return_value = ["U11111"]
 
-                sync_incident_participants_from_slack(incident)
+        sync_incident_participants_from_slack(incident)
 
-                assert incident.participants.count() == 2
-                assert manual_user in incident.participants.all()
-                assert slack_user in incident.participants.all()
+        assert incident.participants.count() == 2
+        assert manual_user in incident.participants.all()
+        assert slack_user in incident.participants.all()
 
-    def test_throttle_skips_recent_sync(self):
+    def test_throttle_skips_recent_sync(self, django_assert_num_queries):
         incident = Incident.objects.create(
             title="Test Incident",
             status=IncidentStatus.ACTIVE,
@@ -143,12 +194,14 @@ class TestSyncIncidentParticipantsFromSlack:
             url="https://workspace.slack.com/archives/C12345",
         )
 
-        stats = sync_incident_participants_from_slack(incident)
+        # The throttle is checked on the loaded instance, before any lookups
+        with django_assert_num_queries(0):
+            stats = sync_incident_participants_from_slack(incident)
 
         assert stats.skipped is True
         assert stats.added == 0
 
-    def test_force_bypasses_throttle(self):
+    def test_force_bypasses_throttle(self, mock_slack):
         incident = Incident.objects.create(
             title="Test Incident",
             status=IncidentStatus.ACTIVE,
@@ -171,58 +224,50 @@ class TestSyncIncidentParticipantsFromSlack:
             external_id="U11111",
         )
 
-        with patch(
-            "firetower.incidents.services._slack_service.parse_channel_id_from_url"
-        ) as mock_parse:
-            mock_parse.return_value = "C12345"
-
-            with patch(
-                "firetower.incidents.services._slack_service.get_channel_members"
-            ) as mock_get_members:
-                mock_get_members.return_value = ["U11111"]
+        mock_slack["parse_channel_id_from_url"].return_value = "C12345"
+        mock_slack["get_channel_members"].return_value = ["U11111"]
 
-                stats = sync_incident_participants_from_slack(incident, force=True)
+        stats = sync_incident_participants_from_slack(incident, force=True)
 
-                assert stats.skipped is False
-                assert stats.added == 1
+        assert stats.skipped is False
+        assert stats.added == 1
 
-    def test_handles_missing_slack_link(self):
+    @pytest.mark.parametrize(
+        "slack_url,channel_id,members,expected_error",
+        [
+            (None, None, None, "No Slack link"),
+            ("https://invalid-url.com", None, None, "Could not parse channel ID"),
+            (
+                "https://workspace.slack.com/archives/C12345",
+                "C12345",
+                None,
+                "Failed to fetch channel members",
+            ),
+        ],
+    )
+    def test_reports_sync_errors(
+        self, mock_slack, slack_url, channel_id, members, expected_error
+    ):
         incident = Incident.objects.create(
             title="Test Incident",
             status=IncidentStatus.ACTIVE,
             severity=IncidentSeverity.P1,
         )
+        if slack_url:
+            ExternalLink.objects.create(
+                incident=incident, type=ExternalLinkType.SLACK, url=slack_url
+            )
+
+        mock_slack["parse_channel_id_from_url"].return_value = channel_id
+        mock_slack["get_channel_members"].return_value = members
 
         stats = sync_incident_participants_from_slack(incident)
 
         assert stats.added == 0
         assert len(stats.errors) == 1
-        assert "No Slack link" in stats.errors[0]
-
-    def test_handles_invalid_channel_url(self):
-        incident = Incident.objects.create(
-            title="Test Incident",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-        )
-        ExternalLink.objects.create(
-            incident=incident,
-            type=ExternalLinkType.SLACK,
-            url="https://invalid-url.com",
-        )
-
-        with patch(
-            "firetower.incidents.services._slack_service.parse_channel_id_from_url"
-        ) as mock_parse:
-            mock_parse.return_value = None
+        assert expected_error in stats.errors[0]
 
-            stats = sync_incident_participants_from_slack(incident)
-
-            assert stats.added == 0
-            assert len(stats.errors) == 1
-            assert "Could not parse channel ID" in stats.errors[0]
-
-    def test_handles_slack_api_failure(self):
+    def test_skips_unresolvable_users(self, mock_slack):
         incident = Incident.objects.create(
             title="Test Incident",
             status=IncidentStatus.ACTIVE,
@@ -234,55 +279,20 @@ class TestSyncIncidentParticipantsFromSlack:
             url="https://workspace.slack.com/archives/C12345",
         )
 
-        with patch(
-            "firetower.incidents.services._slack_service.parse_channel_id_from_url"
-        ) as mock_parse:
-            mock_parse.return_value = "C12345"
-
-            with patch(
-                "firetower.incidents.services._slack_service.get_channel_members"
-            ) as mock_get_members:
-                mock_get_members.return_value = None
-
-                stats = sync_incident_participants_from_slack(incident)
-
-                assert stats.added == 0
-                assert len(stats.errors) == 1
-                assert "Failed to fetch channel members" in stats.errors[0]
-
-    def test_skips_unresolvable_users(self):
-        incident = Incident.objects.create(
-            title="Test Incident",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-        )
-        ExternalLink.objects.create(
-            incident=incident,
-            type=ExternalLinkType.SLACK,
-            url="https://workspace.slack.com/archives/C12345",
-        )
+        mock_slack["parse_channel_id_from_url"].return_value = "C12345"
+        mock_slack["get_channel_members"].return_value = ["U_INVALID"]
 
         with patch(
-            "firetower.incidents.services._slack_service.parse_channel_id_from_url"
-        ) as mock_parse:
-            mock_parse.return_value = "C12345"
-
-            with patch(
-                "firetower.incidents.services._slack_service.get_channel_members"
-            ) as mock_get_members:
-                mock_get_members.return_value = ["U_INVALID"]
-
-                with patch(
-                    "firetower.incidents.services.get_or_create_user_from_slack_id"
-                ) as mock_get_user:
-                    mock_get_user.return_value = None
+            "firetower.incidents.services.get_or_create_user_from_slack_id"
+        ) as mock_get_user:
+            mock_get_user.return_value = None
 
-                    stats = sync_incident_participants_from_slack(incident)
+            stats = sync_incident_participants_from_slack(incident)
 
-                    assert stats.added == 0
-                    assert stats.errors == []
+            assert stats.added == 0
+            assert stats.errors == []
 
-    def test_counts_already_existed_participants(self):
+    def test_counts_already_existed_participants(self, mock_slack):
         incident = Incident.objects.create(
             title="Test Incident",
             status=IncidentStatus.ACTIVE,
@@ -305,23 +315,16 @@ class TestSyncIncidentParticipantsFromSlack:
         )
         incident.participants.add(slack_user)
 
-        with patch(
-            "firetower.incidents.services._slack_service.parse_channel_id_from_url"
-        ) as mock_parse:
-            mock_parse.return_value = "C12345"
-
-            with patch(
-                "firetower.incidents.services._slack_service.get_channel_members"
-            ) as mock_get_members:
-                mock_get_members.return_value = ["U11111"]
+        mock_slack["parse_channel_id_from_url"].return_value = "C12345"
+        mock_slack["get_channel_members"].return_value = ["U11111"]
 
-                stats = sync_incident_participants_from_slack(incident)
+        stats = sync_incident_participants_from_slack(incident)
 
-                assert stats.added == 0
-                assert stats.already_existed == 1
-                assert incident.participants.count() == 1
+        assert stats.added == 0
+        assert stats.already_existed == 1
+        assert incident.participants.count() == 1
 
-    def test_skips_bots(self):
+    def test_skips_bots(self, mock_slack):
         incident = Incident.objects.create(
             title="Test Incident",
             status=IncidentStatus.ACTIVE,
@@ -343,29 +346,24 @@ class TestSyncIncidentParticipantsFromSlack:
             external_id="U11111",
         )
 
-        with patch(
-            "firetower.incidents.services._slack_service.parse_channel_id_from_url"
-        ) as mock_parse:
-            mock_parse.return_value = "C12345"
-
-            with patch(
-                "firetower.incidents.services._slack_service.get_channel_members"
-            ) as mock_get_members:
-                mock_get_members.return_value = ["U11111", "B12345", "BSLACKBOT"]
-
-                with patch(
-                    "firetower.incidents.services.get_or_create_user_from_slack_id"
-                ) as mock_get_user:
-                    mock_get_user.return_value = slack_user
+        mock_slack["parse_channel_id_from_url"].return_value = "C12345"
+        mock_slack["get_channel_members"].return_value = [
+            "U11111",
+            "B12345",
+            "BSLACKBOT",
+        ]
 
-                    stats = sync_incident_participants_from_slack(incident)
+        with patch(
+            "firetower.incidents.services.get_or_create_user_from_slack_id"
+        ) as mock_get_user:
+            stats = sync_incident_participants_from_slack(incident)
 
-                    assert mock_get_user.call_count == 1
-                    mock_get_user.assert_called_once_with("U11111")
-                    assert stats.added == 1
-                    assert stats.errors == []
+            # U11111 resolves from its profile; bots are never looked up
+            mock_get_user.assert_not_called()
+            assert stats.added == 1
+            assert stats.errors == []
 
-    def test_skips_inactive_users(self):
+    def test_skips_inactive_users(self, mock_slack):
         incident = Incident.objects.create(
             title="Test Incident",
             status=IncidentStatus.ACTIVE,
@@ -397,22 +395,15 @@ class TestSyncIncidentParticipantsFromSlack:
             external_id="U_BOT",
         )
 
-        with patch(
-            "firetower.incidents.services._slack_service.parse_channel_id_from_url"
-        ) as mock_parse:
-            mock_parse.return_value = "C12345"
-
-            with patch(
-                "firetower.incidents.services._slack_service.get_channel_members"
-            ) as mock_get_members:
-                mock_get_members.return_value = ["U_ACTIVE", "U_BOT"]
+        mock_slack["parse_channel_id_from_url"].return_value = "C12345"
+        mock_slack["get_channel_members"].return_value = ["U_ACTIVE", "U_BOT"]
 
-                stats = sync_incident_participants_from_slack(incident)
+        stats = sync_incident_participants_from_slack(incident)
 
-                assert stats.added == 1
-                assert incident.participants.count() == 1
-                assert active_user in incident.participants.all()
-                assert inactive_user not in incident.participants.all()
+        assert stats.added == 1
+        assert incident.participants.count() == 1
+        assert active_user in incident.participants.all()
+        assert inactive_user not in incident.participants.all()
 
 
 @pytest.mark.django_db
@@ -16,6 +16,7 @@ from firetower.incidents.models import (
     Incident,
     IncidentSeverity,
     IncidentStatus,
+    ServiceTier,
     Tag,
     TagType,
 )
@@ -33,18 +34,20 @@ class TestIncidentViews:
             password="testpass123",
         )
 
-    def test_list_incidents(self):
+    def test_list_incidents(self, bulk_create_incidents):
         """Test GET /api/ui/incidents/ returns list of incidents"""
         # Create test incidents
-        Incident.objects.create(
-            title="Test Incident 1",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-        )
-        Incident.objects.create(
-            title="Test Incident 2",
-            status=IncidentStatus.MITIGATED,
-            severity=IncidentSeverity.P2,
+        bulk_create_incidents(
+            Incident(
+                title="Test Incident 1",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+            ),
+            Incident(
+                title="Test Incident 2",
+                status=IncidentStatus.MITIGATED,
+                severity=IncidentSeverity.P2,
+            ),
         )
 
         self.client.force_authenticate(user=self.user)
@@ -61,27 +64,29 @@ class TestIncidentViews:
         assert "status" in incident
         assert "severity" in incident
 
-    def test_list_incidents_respects_privacy(self):
+    def test_list_incidents_respects_privacy(self, bulk_create_incidents):
         """Test private incidents are filtered correctly"""
         # Create public and private incidents
-        Incident.objects.create(
-            title="Public Incident",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-            is_private=False,
-        )
-        Incident.objects.create(
-            title="Private Incident",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-            is_private=True,
-            captain=self.user,
-        )
-        Incident.objects.create(
-            title="Someone Else's Private",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-            is_private=True,
+        bulk_create_incidents(
+            Incident(
+                title="Public Incident",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+                is_private=False,
+            ),
+            Incident(
+                title="Private Incident",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+                is_private=True,
+                captain=self.user,
+            ),
+            Incident(
+                title="Someone Else's Private",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+                is_private=True,
+            ),
         )
 
         self.client.force_authenticate(user=self.user)
@@ -96,22 +101,64 @@ class TestIncidentViews:
         assert "Private Incident" in titles
         assert "Someone Else's Private" not in titles
 
-    def test_list_incidents_defaults_to_active_and_mitigated(self):
-        """Test that no status filter defaults to Active and Mitigated"""
-        Incident.objects.create(
-            title="Active Incident",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
+    def test_list_incidents_query_count_independent_of_results(
+        self, bulk_create_incidents, assert_query_count_stable
+    ):
+        """Test GET /api/ui/incidents/ joins captains instead of querying per row"""
+        captains = [
+            User.objects.create_user(
+                username=f"captain{i}@example.com", email=f"captain{i}@example.com"
+            )
+            for i in range(4)
+        ]
+        bulk_create_incidents(
+            Incident(
+                title="Mitigated",
+                status=IncidentStatus.MITIGATED,
+                severity=IncidentSeverity.P1,
+                captain=captains[0],
+            ),
+            *(
+                Incident(
+                    title=f"Active {i}",
+                    status=IncidentStatus.ACTIVE,
+                    severity=IncidentSeverity.P1,
+                    captain=captain,
+                )
+                for i, captain in enumerate(captains[1:])
+            ),
         )
-        Incident.objects.create(
-            title="Mitigated Incident",
-            status=IncidentStatus.MITIGATED,
-            severity=IncidentSeverity.P2,
+
+        self.client.force_authenticate(user=self.user)
+        response = assert_query_count_stable(
+            self.client,
+            "/api/ui/incidents/?status=Mitigated",
+            "/api/ui/incidents/?status=Active",
         )
-        Incident.objects.create(
-            title="Done Incident",
-            status=IncidentStatus.DONE,
-            severity=IncidentSeverity.P3,
+
+        assert response.status_code == 200
+        assert response.data["count"] == 3
+
+    def test_list_incidents_defaults_to_active_and_mitigated(
+        self, bulk_create_incidents
+    ):
+        """Test that no status filter defaults to Active and Mitigated"""
+        bulk_create_incidents(
+            Incident(
+                title="Active Incident",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+            ),
+            Incident(
+                title="Mitigated Incident",
+                status=IncidentStatus.MITIGATED,
+                severity=IncidentSeverity.P2,
+            ),
+            Incident(
+                title="Done Incident",
+                status=IncidentStatus.DONE,
+                severity=IncidentSeverity.P3,
+            ),
         )
 
         self.client.force_authenticate(user=self.user)
@@ -177,6 +224,58 @@ class TestIncidentViews:
         assert "external_links" in data
         assert data["external_links"]["slack"] == "https://slack.com/test"
 
+    def test_retrieve_incident_query_count_independent_of_relations(
+        self, bulk_create_incidents, assert_query_count_stable
+    ):
+        """Test incident detail query count doesn't grow with participants or tags"""
+        small, large = bulk_create_incidents(
+            Incident(
+                title="Small",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+                captain=self.user,
+            ),
+            Incident(
+                title="Large",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+                captain=self.user,
+            ),
+        )
+        participants = [
+            User.objects.create_user(
+                username=f"participant{i}@example.com",
+                email=f"participant{i}@example.com",
+            )
+            for i in range(4)
+        ]
+        tags = Tag.objects.bulk_create(
+            Tag(name=f"Service {i}", type=TagType.AFFECTED_SERVICE) for i in range(4)
+        )
+        small.participants.add(participants[0])
+        small.affected_service_tags.add(tags[0])
+        large.participants.add(*participants[1:])
+        large.affected_service_tags.add(*tags[1:])
+        ExternalLink.objects.bulk_create(
+            ExternalLink(
+                incident=incident,
+                type=ExternalLinkType.SLACK,
+                url=f"https://slack.com/{incident.id}",
+            )
+            for incident in (small, large)
+        )
+
+        self.client.force_authenticate(user=self.user)
+        with patch("firetower.incidents.views.sync_incident_participants_from_slack"):
+            response = assert_query_count_stable(
+                self.client,
+                f"/api/ui/incidents/{small.incident_number}/",
+                f"/api/ui/incidents/{large.incident_number}/",
+            )
+
+        assert response.status_code == 200
+        assert len(response.data["incident"]["participants"]) == 4
+
     def test_retrieve_incident_respects_privacy(self):
         """Test private incident detail respects permissions"""
         other_user = User.objects.create_user(
@@ -211,7 +310,7 @@ class TestIncidentViews:
 
         assert response.status_code == 404
 
-    def test_superuser_cannot_see_private_incidents(self):
+    def test_superuser_cannot_see_private_incidents(self, bulk_create_incidents):
         """Test superuser cannot see private incidents they are not involved in"""
         superuser = User.objects.create_superuser(
             username="admin@example.com",
@@ -219,17 +318,19 @@ class TestIncidentViews:
             password="testpass123",
         )
 
-        Incident.objects.create(
-            title="Public",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-            is_private=False,
-        )
-        Incident.objects.create(
-            title="Private",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-            is_private=True,
+        bulk_create_incidents(
+            Incident(
+                title="Public",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+                is_private=False,
+            ),
+            Incident(
+                title="Private",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+                is_private=True,
+            ),
         )
 
         self.client.force_authenticate(user=superuser)
@@ -606,9 +707,10 @@ class TestIncidentAPIViews:
         response = self.client.post("/api/incidents/", data, format="json")
 
         assert response.status_code == 201
-        assert Incident.objects.count() == 1
+        incidents = list(Incident.objects.select_related("captain", "reporter"))
+        assert len(incidents) == 1
 
-        incident = Incident.objects.first()
+        incident = incidents[0]
         assert incident.title == "New Incident"
         assert incident.severity == IncidentSeverity.P1
         assert incident.is_private is False
@@ -721,19 +823,21 @@ class TestIncidentAPIViews:
         assert incident.captain.first_name == ""
         assert incident.captain.last_name == ""
 
-    def test_list_api_incidents(self):
+    def test_list_api_incidents(self, bulk_create_incidents):
         """Test GET /api/incidents/ returns all visible incidents"""
-        Incident.objects.create(
-            title="Public Incident",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-            is_private=False,
-        )
-        Incident.objects.create(
-            title="Done Incident",
-            status=IncidentStatus.DONE,
-            severity=IncidentSeverity.P2,
-            is_private=False,
+        bulk_create_incidents(
+            Incident(
+                title="Public Incident",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+                is_private=False,
+            ),
+            Incident(
+                title="Done Incident",
+                status=IncidentStatus.DONE,
+                severity=IncidentSeverity.P2,
+                is_private=False,
+            ),
         )
 
         self.client.force_authenticate(user=self.user)
@@ -743,6 +847,52 @@ class TestIncidentAPIViews:
         assert response.data["count"] == 2
         assert len(response.data["results"]) == 2
 
+    def test_list_api_incidents_query_count_independent_of_results(
+        self, bulk_create_incidents, assert_query_count_stable
+    ):
+        """Test GET /api/incidents/ prefetches relations instead of querying per row"""
+        tag = Tag.objects.create(name="API", type=TagType.AFFECTED_SERVICE)
+        incidents = bulk_create_incidents(
+            Incident(
+                title="Mitigated",
+                status=IncidentStatus.MITIGATED,
+                severity=IncidentSeverity.P1,
+                captain=self.captain,
+                reporter=self.reporter,
+            ),
+            *(
+                Incident(
+                    title=f"Active {i}",
+                    status=IncidentStatus.ACTIVE,
+                    severity=IncidentSeverity.P1,
+                    captain=self.captain,
+                    reporter=self.reporter,
+                )
+                for i in range(3)
+            ),
+        )
+        for incident in incidents:
+            incident.participants.add(self.user)
+            incident.affected_service_tags.add(tag)
+        ExternalLink.objects.bulk_create(
+            ExternalLink(
+                incident=incident,
+                type=ExternalLinkType.SLACK,
+                url=f"https://slack.com/{incident.id}",
+            )
+            for incident in incidents
+        )
+
+        self.client.force_authenticate(user=self.user)
+        response = assert_query_count_stable(
+            self.client,
+            "/api/incidents/?status=Mitigated",
+            "/api/incidents/?status=Active",
+        )
+
+        assert response.status_code == 200
+        assert response.data["count"] == 3
+
     def test_retrieve_api_incident(self):
         """Test GET /api/incidents/INC-{id}/ returns incident with proper format"""
         incident = Incident.objects.create(
@@ -939,27 +1089,29 @@ class TestIncidentAPIViews:
         incident.refresh_from_db()
         assert incident.title == "Updated by admin"
 
-    def test_api_respects_privacy_on_read(self):
+    def test_api_respects_privacy_on_read(self, bulk_create_incidents):
         """Test API list respects incident privacy"""
-        Incident.objects.create(
-            title="Public",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-            is_private=False,
-        )
-        Incident.objects.create(
-            title="Private - captain",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-            is_private=True,
-            captain=self.user,
-        )
-        Incident.objects.create(
-            title="Private - other",
-            status=IncidentStatus.ACTIVE,
-            severity=IncidentSeverity.P1,
-            is_private=True,
-            captain=self.captain,
+        bulk_create_incidents(
+            Incident(
+                title="Public",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+                is_private=False,
+            ),
+            Incident(
+                title="Private - captain",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+                is_private=True,
+                captain=self.user,
+            ),
+            Incident(
+                title="Private - other",
+                status=IncidentStatus.ACTIVE,
+                severity=IncidentSeverity.P1,
+                is_private=True,
+                captain=self.captain,
+            ),
         )
 
         self.client.force_authenticate(user=self.user)
@@ -1941,3 +2093,39 @@ class TestActionItemListView:
             response = self.client.get(self._url(private_incident.incident_number))
 
         assert response.status_code == 404
+
+
+@pytest.mark.django_db
+class TestAvailabilityView:
+    def setup_method(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username="test@example.com",
+            email="test@example.com",
+        )
+
+    def test_incident_counted_once_with_several_availability_tags(self, settings):
+        """Test an incident matching the availability tag twice is counted once"""
+        settings.REGION_GROUPING = []
+        region = Tag.objects.create(name="us-east-1", type=TagType.AFFECTED_REGION)
+        incident = Incident.objects.create(
+            title="Outage",
+            status=IncidentStatus.ACTIVE,
+            severity=IncidentSeverity.P1,
+            service_tier=ServiceTier.T0,
+            total_downtime=30,
+        )
+        # Tag names are only unique per type, and the M2M doesn't restrict type
+        incident.impact_type_tags.add(
+            Tag.objects.create(name="availability", type=TagType.IMPACT_TYPE),
+            Tag.objects.create(name="availability", type=TagType.ROOT_CAUSE),
+        )
+        incident.affected_region_tags.add(region)
+
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get("/api/ui/availability/")
+
+        assert response.status_code == 200
+        (current_month,) = response.data["months"][0]["regions"]
+        assert current_month["incident_count"] == 1
+        assert current_month["total_downtime_minutes"] == 30
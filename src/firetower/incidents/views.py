@@ -165,9 +165,9 @@ class IncidentDetailUIView(generics.RetrieveAPIView):
 
     def get_queryset(self) -> QuerySet[Incident]:
         """Get base queryset with optimized prefetching"""
-        return Incident.objects.prefetch_related(
-            "captain__userprofile",
-            "reporter__userprofile",
+        return Incident.objects.select_related(
+            "captain__userprofile", "reporter__userprofile"
+        ).prefetch_related(
             "participants__userprofile",
             "affected_service_tags",
             "affected_region_tags",
@@ -224,7 +224,16 @@ class IncidentListCreateAPIView(generics.ListCreateAPIView):
         return IncidentReadSerializer
 
     def get_queryset(self) -> QuerySet[Incident]:
-        queryset = Incident.objects.all()
+        queryset = Incident.objects.select_related(
+            "captain", "reporter"
+        ).prefetch_related(
+            "participants",
+            "affected_service_tags",
+            "affected_region_tags",
+            "root_cause_tags",
+            "impact_type_tags",
+            "external_links",
+        )
         queryset = filter_visible_to_user(queryset, self.request.user)
         queryset = filter_by_status(queryset, self.request)
         queryset = filter_by_severity(queryset, self.request)
@@ -260,9 +269,9 @@ class IncidentRetrieveUpdateAPIView(generics.RetrieveUpdateAPIView):
 
     def get_queryset(self) -> QuerySet[Incident]:
         """Get base queryset with optimized prefetching"""
-        return Incident.objects.prefetch_related(
-            "captain__userprofile",
-            "reporter__userprofile",
+        return Incident.objects.select_related(
+            "captain__userprofile", "reporter__userprofile"
+        ).prefetch_related(
             "participants__userprofile",
             "affected_service_tags",
             "affected_region_tags",
@@ -559,17 +568,18 @@ class AvailabilityView(APIView):
         incidents_by_tag: dict[int, list[Incident]] = defaultdict(list)
         if all_periods and tags:
             earliest_start = min(p["start"] for p in all_periods)
-            incidents = list(
-                filter_visible_to_user(
-                    Incident.objects.filter(
-                        created_at__gte=earliest_start,
-                        created_at__lte=now,
-                        impact_type_tags__name="availability",
-                        service_tier=ServiceTier.T0,
-                    ),
-                    request.user,
-                ).prefetch_related("affected_region_tags")
-            )
+            # The impact_type_tags join can match more than one tag named
+            # "availability", so collapse duplicate incidents.
+            queryset = filter_visible_to_user(
+                Incident.objects.filter(
+                    created_at__gte=earliest_start,
+                    created_at__lte=now,
+                    impact_type_tags__name="availability",
+                    service_tier=ServiceTier.T0,
+                ),
+                request.user,
+            ).distinct()
+            incidents = list(queryset.prefetch_related("affected_region_tags"))
             incidents_by_tag = build_incidents_by_tag(incidents)
 
         def build_periods(raw_periods: list[dict]) -> list[dict]:
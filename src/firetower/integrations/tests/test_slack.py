@@ -2,22 +2,13 @@
 Basic pytest tests for Slack integration service.
 """
 
-import os
 from unittest.mock import MagicMock, patch
 
+from django.conf import settings
 from slack_sdk.errors import SlackApiError
 
 from firetower.integrations.services.slack import SlackService, is_slack_guest
 
-# Set up Django settings
-os.environ.setdefault("DJANGO_SETTINGS_MODULE", "firetower.settings")
-
-import django
-from django.conf import settings
-
-# Setup Django
-django.setup()
-
 
 class TestSlackService:
     """Test suite for SlackService"""